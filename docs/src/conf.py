@@ -1,15 +1,14 @@
 # Configuration file for the Sphinx documentation builder.
-import os
 import sys
-import re
 
-# Make the project root importable
-sys.path.insert(0, os.path.abspath("../.."))
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
 extensions = [
     "sphinx.ext.napoleon",  # For Google/NumPy style docstrings
     "sphinx.ext.viewcode",  # Add source code links
-    "sphinx_autodoc_typehints",
     "sphinx_mdinclude",
     "autoapi.extension",
     "nbsphinx",
@@ -19,13 +18,12 @@ project = "flowtube"
 copyright = "2025, Corey Pedersen"
 author = "Corey Pedersen"
 
-with open("../../pyproject.toml") as f:
-    text = f.read()
-match = re.search(r'version\s*=\s*"([^"]+)"', text)
-if match:
-    release = match.group(1)
-else:
-    raise ValueError("Version not found in pyproject.toml")
+with open("../../pyproject.toml", "rb") as f:
+    pyproject = tomllib.load(f)
+try:
+    release = pyproject["project"]["version"]
+except KeyError as e:
+    raise ValueError("Version not found in pyproject.toml") from e
 
 version = release.rsplit(".", 1)[0]  # Short version (e.g., "1.2")
 
@@ -36,6 +34,7 @@ autoapi_options = [
     "show-module-summary",
 ]
 autoapi_dirs = ["../../flowtube/"]
+autoapi_type = "python"
 
 napoleon_google_docstring = True
 napoleon_numpy_docstring = True
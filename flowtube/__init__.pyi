@@ -90,6 +90,10 @@ class CoatedWallReactor:
     k: float
     uptake: float
 
+    def reactant_uptake_batch(
+        self,
+        hypothetical_gamma: NDArray[np.float64],
+    ) -> NDArray[np.float64]: ...
     def calculate_gamma(
         self,
         concentrations: NDArray[np.float64],
@@ -182,6 +186,10 @@ class BoatReactor:
     k: float
     uptake: float
 
+    def reactant_uptake_batch(
+        self,
+        hypothetical_gamma: NDArray[np.float64],
+    ) -> NDArray[np.float64]: ...
     def calculate_gamma_effective(
         self,
         concentrations: NDArray[np.float64],
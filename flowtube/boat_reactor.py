@@ -220,10 +220,10 @@ class BoatReactor:
             raise ValueError(" Flow rates must be positive or zero")
 
         # Check if the pressure units are supported
-        if P_units not in tools.P_CF.keys():
+        if P_units.casefold() not in tools.P_CF:
             raise ValueError(
                 f"Unsupported pressure units. "
-                f"Supported units: {', '.join(tools.P_CF.keys())}"
+                f"Supported units: {', '.join(tools.P_UNITS)}"
             )
         elif P < 0:
             raise ValueError("Pressure must be positive")
@@ -390,6 +390,9 @@ class BoatReactor:
         var_fmts += [".3g"]
         units += ["cm s-1"]
 
+        # Flow velocity over the coated region, used when fitting uptake
+        self._flow_velocity = self.flow_velocity
+
         # Residence Time over the boat
         self.residence_time = self.boat_length / self.flow_velocity
         var_names += ["Residence Time Over Boat"]
@@ -654,21 +657,7 @@ class BoatReactor:
         """
 
         ### Check for valid inputs ###
-        if not isinstance(hypothetical_gamma, (int, float)):
-            try:
-                hypothetical_gamma = np.asarray(hypothetical_gamma, dtype=np.float64)
-            except Exception as e:
-                raise TypeError(
-                    "Gamma input must be int, float, or Array-like of int "
-                    f"or float; got {type(hypothetical_gamma)}"
-                ) from e
-
-            if hypothetical_gamma.ndim != 1:
-                raise ValueError("Gamma input must be 1-dimensional.")
-
-        # Check if hypothetical_gamma is between 0 and 1
-        if np.min(hypothetical_gamma) < 0 or np.max(hypothetical_gamma) > 1:  # pyright: ignore[reportUnknownMemberType]
-            raise ValueError("Hypothetical gamma must be between 0 and 1")
+        hypothetical_gamma = tools.check_hypothetical_gamma(hypothetical_gamma)
 
         # Check if gamma_wall is between 0 and 1
         if gamma_wall < 0 or gamma_wall > 1:
@@ -705,28 +694,19 @@ class BoatReactor:
         var_fmts += [".1f"]
         units += ["%"]
 
-        # Geometric correction for boat geometry – Hanson and Ravishankara, 1993
-        cylinder_SA_V_ratio = 4 / self.FT_ID
-        actual_SA_V_ratio = self.boat_liquid_width / self.net_cross_section
-        self.geometric_correction = cylinder_SA_V_ratio / actual_SA_V_ratio
+        # Geometric correction, loss rate (s-1), and uptake to boat
+        # - see _boat_uptake for details
+        self.geometric_correction, self.k, self.uptake = self._boat_uptake(
+            hypothetical_gamma
+        )
         var_names += ["Boat geometry correction factor"]
         var += [self.geometric_correction]
         var_fmts += [".2f"]
         units += ["unitless"]
-
-        # Corrected Loss Rate (s-1)
-        # - see kinetics.py and Hanson and Ravishankara, 1993 for details
-        self.k = (
-            kinetics.observed_loss_rate(self, self.FT_ID, hypothetical_gamma)
-            / self.geometric_correction
-        )
         var_names += ["Loss Rate"]
         var += [self.k]
         var_fmts += [".3g"]
         units += ["s-1"]
-
-        # Uptake to boat (fraction) - first order kinetics
-        self.uptake = 1 - np.exp(-self.k * self.residence_time / 4)
         var_names += ["Loss to Boat - 1/4 Length"]
         var += [self.uptake * 100]
         var_fmts += [".1f"]
@@ -757,6 +737,71 @@ class BoatReactor:
                 units,
             )
 
+    def reactant_uptake_batch(
+        self,
+        hypothetical_gamma: ArrayLike,
+    ) -> NDArray[np.float64]:
+        """
+        Calculates reactant uptake to the boat for a sweep of
+        hypothetical uptake coefficients. Unlike reactant_uptake,
+        accepts arrays of any shape and returns the result without
+        displaying or storing it.
+
+        Args:
+            hypothetical_gamma (ArrayLike): Hypothetical uptake
+                coefficients (unitless).
+
+        Returns:
+            NDArray: Fractional loss to the boat over 1/4 of its length,
+                with the same shape as hypothetical_gamma.
+        """
+
+        ### Check for valid inputs ###
+        hypothetical_gamma = tools.check_hypothetical_gamma(
+            hypothetical_gamma, any_shape=True
+        )
+        if not hasattr(self, "reactant_molec_velocity"):
+            raise RuntimeError("Must call initialize() before reactant_uptake_batch()")
+
+        _, _, uptake = self._boat_uptake(hypothetical_gamma)
+
+        return np.asarray(uptake)
+
+    def _boat_uptake(
+        self,
+        hypothetical_gamma: NDArray[np.float64] | float,
+    ) -> tuple[float, NDArray[np.float64] | float, NDArray[np.float64] | float]:
+        """
+        Calculates the boat geometric correction, corrected loss rate,
+        and fractional loss to the boat over 1/4 of its length.
+
+        Args:
+            hypothetical_gamma (NDArray or float): Hypothetical uptake
+                coefficient (unitless).
+
+        Returns:
+            float: Geometric correction factor (unitless).
+            NDArray or float: Corrected loss rate (s-1).
+            NDArray or float: Fractional loss to the boat.
+        """
+        # Geometric correction for boat geometry – Hanson and Ravishankara, 1993
+        cylinder_SA_V_ratio = 4 / self.FT_ID
+        actual_SA_V_ratio = self.boat_liquid_width / self.net_cross_section
+        geometric_correction = cylinder_SA_V_ratio / actual_SA_V_ratio
+
+        # Corrected Loss Rate (s-1)
+        # - see kinetics.py and Hanson and Ravishankara, 1993 for details
+        k = (
+            kinetics.observed_loss_rate(self, self.FT_ID, hypothetical_gamma)
+            / geometric_correction
+        )
+
+        # Uptake to boat (fraction) - first order kinetics
+        # 1 - exp(-x) as -expm1(-x) avoids cancellation for small x
+        uptake = -np.expm1(-k * self.residence_time / 4)
+
+        return geometric_correction, k, uptake
+
     def calculate_gamma_effective(
         self,
         concentrations: ArrayLike,
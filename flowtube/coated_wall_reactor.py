@@ -211,10 +211,10 @@ class CoatedWallReactor:
             raise ValueError(" Flow rates must be positive or zero")
 
         # Check if the pressure units are supported
-        if P_units not in tools.P_CF.keys():
+        if P_units.casefold() not in tools.P_CF:
             raise ValueError(
                 f"Unsupported pressure units. "
-                f"Supported units: {', '.join(tools.P_CF.keys())}"
+                f"Supported units: {', '.join(tools.P_UNITS)}"
             )
         elif P < 0:
             raise ValueError("Pressure must be positive")
@@ -379,6 +379,10 @@ class CoatedWallReactor:
         var_fmts += [".3g"]
         units += ["cm s-1"]
 
+        # Flow velocity over the coated region, used when fitting uptake
+        # (overridden below when an insert is present)
+        self._flow_velocity = self.FT_flow_velocity
+
         # Insert flow velocity
         # - accounts for flow around outside of insert and through inside of insert
         if self.insert_length > 0:
@@ -399,6 +403,7 @@ class CoatedWallReactor:
             var += [self.insert_flow_velocity]
             var_fmts += [".3g"]
             units += ["cm s-1"]
+            self._flow_velocity = self.insert_flow_velocity
 
         # Residence Times
         self.FT_residence_time = self.FT_length / self.FT_flow_velocity
@@ -738,26 +743,12 @@ class CoatedWallReactor:
         """
 
         ### Check for valid inputs ###
-        if not isinstance(hypothetical_gamma, (int, float)):
-            try:
-                hypothetical_gamma = np.asarray(hypothetical_gamma, dtype=np.float64)
-            except Exception as e:
-                raise TypeError(
-                    "Gamma input must be int, float, or Array-like of int "
-                    f"or float; got {type(hypothetical_gamma)}"
-                ) from e
-
-            if hypothetical_gamma.ndim != 1:
-                raise ValueError("Gamma input must be 1-dimensional.")
-            
+        hypothetical_gamma = tools.check_hypothetical_gamma(hypothetical_gamma)
+
         # Check exposure time
         if exposure_time <= 0:
             raise ValueError("Exposure time must be a positive number.")
 
-        # Check if hypothetical_gamma is between 0 and 1
-        if np.min(hypothetical_gamma) < 0 or np.max(hypothetical_gamma) > 1:
-            raise ValueError("Hypothetical gamma must be between 0 and 1")
-
         # Check if gamma_wall is between 0 and 1
         if gamma_wall < 0 or gamma_wall > 1:
             raise ValueError("Wall uptake coefficient must be between 0 and 1")
@@ -824,25 +815,10 @@ class CoatedWallReactor:
         units += ["s-1"]
 
         # Uptake to coated region - see kinetics.py for details
+        self.uptake = self._coated_region_uptake(hypothetical_gamma)
         if self.insert_length > 0:
-            self.uptake = kinetics.cylinder_loss(
-                self,
-                self.insert_ID,
-                self.N_eff_Shw_insert,
-                self.Kn_insert,
-                hypothetical_gamma,
-                self.insert_length / self.insert_flow_velocity / 4,
-            )
             var_names += ["Insert Loss - 1/4 Length"]
         else:
-            self.uptake = kinetics.cylinder_loss(
-                self,
-                self.FT_ID,
-                self.N_eff_Shw_FT,
-                self.Kn_FT,
-                hypothetical_gamma,
-                self.FT_residence_time / 4,
-            )
             var_names += ["Flow Tube Loss - 1/4 Length"]
         var += [self.uptake * 100]
         var_fmts += [".1f"]
@@ -889,6 +865,67 @@ class CoatedWallReactor:
                 units,
             )
 
+    def reactant_uptake_batch(
+        self,
+        hypothetical_gamma: ArrayLike,
+    ) -> NDArray[np.float64]:
+        """
+        Calculates reactant uptake to the coated wall or insert for a
+        sweep of hypothetical uptake coefficients. Unlike
+        reactant_uptake, accepts arrays of any shape and returns the
+        result without displaying or storing it.
+
+        Args:
+            hypothetical_gamma (ArrayLike): Hypothetical uptake
+                coefficients (unitless).
+
+        Returns:
+            NDArray: Fractional loss to the coated region over 1/4 of
+                its length, with the same shape as hypothetical_gamma.
+        """
+
+        ### Check for valid inputs ###
+        hypothetical_gamma = tools.check_hypothetical_gamma(
+            hypothetical_gamma, any_shape=True
+        )
+        if not hasattr(self, "reactant_molec_velocity"):
+            raise RuntimeError("Must call initialize() before reactant_uptake_batch()")
+
+        return np.asarray(self._coated_region_uptake(hypothetical_gamma))
+
+    def _coated_region_uptake(
+        self,
+        hypothetical_gamma: NDArray[np.float64] | float,
+    ) -> NDArray[np.float64] | float:
+        """
+        Calculates fractional loss to the coated wall or insert over 1/4
+        of its length - see kinetics.py for details.
+
+        Args:
+            hypothetical_gamma (NDArray or float): Hypothetical uptake
+                coefficient (unitless).
+
+        Returns:
+            NDArray or float: Fractional loss to the coated region.
+        """
+        if self.insert_length > 0:
+            return kinetics.cylinder_loss(
+                self,
+                self.insert_ID,
+                self.N_eff_Shw_insert,
+                self.Kn_insert,
+                hypothetical_gamma,
+                self.insert_length / self.insert_flow_velocity / 4,
+            )
+        return kinetics.cylinder_loss(
+            self,
+            self.FT_ID,
+            self.N_eff_Shw_FT,
+            self.Kn_FT,
+            hypothetical_gamma,
+            self.FT_residence_time / 4,
+        )
+
     def calculate_gamma_effective(
         self,
         concentrations: ArrayLike,
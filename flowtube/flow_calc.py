@@ -257,7 +257,7 @@ def conductance(
         * diameter**4
         / (obj.carrier_dynamic_viscosity * 1e7 * length)
         * obj.P
-        / tools.P_CF["Torr"]
+        / tools.P_CF["torr"]
     )
 
 
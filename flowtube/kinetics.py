@@ -9,10 +9,15 @@ Citations:
 """
 
 from .flow_calc import full_attrs, carrier_attrs
+import math
 import numpy as np
 from numpy.typing import NDArray, ArrayLike
 from scipy.stats import linregress
 
+# Supported exposure units for fit_first_order_kinetics
+_TIME_UNITS = frozenset({"s", "sec", "second", "seconds"})
+_LENGTH_UNITS = frozenset({"cm", "centimeter", "centimeters"})
+
 
 ### KPS Method Calculations ###
 def diffusion_limited_rate_constant(
@@ -36,7 +41,7 @@ def diffusion_limited_rate_constant(
         float: Diffusion limited rate constant (s-1).
     """
 
-    return 4 * N_eff_Shw * obj.reactant_diffusion_rate / diameter**2
+    return 4 * N_eff_Shw * obj.reactant_diffusion_rate / (diameter * diameter)
 
 
 def diffusion_limited_uptake_coefficient(
@@ -82,7 +87,7 @@ def correction_factor_from_gamma(
         float: Correction factor (unitless).
     """
 
-    return 1 / (1 + gamma * 3 / (2 * N_eff_Shw * Kn))
+    return 1 / (1 + gamma * (3 / (2 * N_eff_Shw * Kn)))
 
 
 def correction_factor_from_effective_gamma(
@@ -136,7 +141,7 @@ def cylinder_loss(
     N_eff_Shw: float,
     Kn: float,
     gamma: NDArray[np.float64] | float,
-    time: float,
+    time: NDArray[np.float64] | float,
 ) -> NDArray[np.float64] | float:
     """
     Calculate penetration (unitless) - eq. 21 from Knopf et al., 2015.
@@ -146,20 +151,32 @@ def cylinder_loss(
             reactant_diffusion_rate in cm2 s-1,
             carrier_dynamic_viscosity in kg m-1 s-1,
             carrier_density in kg m-3).
-        time (float): Residence time in cylinder (s).
+        diameter (float): Diameter of the cylinder (cm).
+        N_eff_Shw (float): Effective Sherwood number (unitless).
+        Kn (float): Knudsen number (unitless).
+        gamma (float or NDArray): Uptake coefficient (unitless).
+        time (float or NDArray): Residence time in cylinder (s).
 
     Returns:
-        float: Penetration - fraction of initial reactant after passing
-            through cylinder (unitless).
+        float or NDArray: Penetration - fraction of initial reactant
+            after passing through cylinder (unitless), broadcast over
+            gamma and time.
     """
 
-    return 1 - np.exp(
-        -gamma
-        / (1 + gamma * 3 / (2 * N_eff_Shw * Kn))
-        * obj.reactant_molec_velocity
-        / diameter
-        * time
-    )
+    # Effective uptake coefficient - eq. 15 from Knopf et al., 2015
+    gamma_eff = gamma * correction_factor_from_gamma(N_eff_Shw, Kn, gamma)
+
+    # Collapse the scalar terms so array gamma only sees the minimum
+    # number of elementwise passes
+    v_over_d_time = obj.reactant_molec_velocity / diameter * time
+
+    x = gamma_eff * v_over_d_time
+
+    # 1 - exp(-x) as -expm1(-x) avoids cancellation for small x; scalar
+    # inputs (e.g. wall loss) skip NumPy ufunc dispatch
+    if isinstance(x, np.ndarray):
+        return -np.expm1(-x)
+    return -math.expm1(-x)
 
 
 ### Uptake Kinetics Calculations ###
@@ -187,26 +204,57 @@ def gamma_from_k(
     return k * diameter / obj.reactant_molec_velocity
 
 
+def _fast_slope(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+) -> float:
+    """
+    Least-squares slope of y on x, skipping the r-value, p-value, and
+    standard error that linregress computes.
+
+    Args:
+        x (NDArray): Independent variable.
+        y (NDArray): Dependent variable.
+
+    Returns:
+        float: Slope of the linear regression.
+
+    Raises:
+        ValueError: If all x values are identical (same as linregress).
+    """
+
+    dx = x - x.mean()
+    ssx = (dx * dx).sum()
+    if ssx == 0:
+        raise ValueError(
+            "Cannot calculate a linear regression if all x values are identical"
+        )
+
+    return (dx * (y - y.mean())).sum() / ssx
+
+
 def fit_first_order_kinetics(
     obj: carrier_attrs,
     concentrations: ArrayLike,
     exposure: ArrayLike,
     exposure_units: str,
+    compute_stats: bool = True,
 ) -> tuple[float, float, float, float, float]:
     """
     Fits the observed loss to a first order kinetic model to extract the
     uptake coefficient.
 
     Args:
-        obj (carrier_attrs): Object with carrier attributes
-            (flow_velocity in cm s-1 needed).
-            carrier_dynamic_viscosity in kg m-1 s-1,
-            carrier_density in kg m-3).
+        obj (carrier_attrs): Reactor object initialized via
+            initialize() (provides the flow velocity in cm s-1).
         concentrations (ArrayLike): Array of observed
             concentrations (unitless).
         exposure (ArrayLike): Array of exposures (s or cm).
         exposure_units (str): Units of exposure ("s", "sec", "second",
             "seconds", "cm", "centimeter", "centimeters").
+        compute_stats (bool, default: True): Compute the r-value,
+            p-value, and standard error. If False, only the slope and
+            intercept are computed and the remaining values are NaN.
 
     Returns:
         float: Slope of the linear regression.
@@ -225,8 +273,13 @@ def fit_first_order_kinetics(
         ) from e
     if concentrations.ndim != 1:
         raise ValueError("Concentration input must be 1-dimensional.")
-    if (concentrations < 0).any():
-        raise ValueError("Concentrations must be non-negative")
+
+    # Log transform doubles as the validity check: non-positive or
+    # non-finite concentrations give NaN/inf
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_concentrations = np.log(concentrations)
+    if not np.isfinite(log_concentrations).all():
+        raise ValueError("Concentrations must be positive and finite")
 
     try:
         exposure = np.asarray(exposure, dtype=np.float64)
@@ -240,20 +293,15 @@ def fit_first_order_kinetics(
     if len(concentrations) != len(exposure):
         raise ValueError("Concentration and exposure inputs must have the same length.")
 
-    # Find which flow velocity to use
-    if hasattr(obj, "insert_flow_velocity"):
-        flow_velocity = obj.insert_flow_velocity  # pyright: ignore[reportAttributeAccessIssue]
-    elif hasattr(obj, "flow_velocity"):
-        flow_velocity = obj.flow_velocity  # pyright: ignore[reportAttributeAccessIssue]
-    elif hasattr(obj, "FT_flow_velocity"):
-        flow_velocity = obj.FT_flow_velocity  # pyright: ignore[reportAttributeAccessIssue]
-    else:
+    # Flow velocity over the coated region, resolved by flows()
+    flow_velocity = getattr(obj, "_flow_velocity", None)
+    if flow_velocity is None:
         raise RuntimeError("Must call initialize() prior to fitting")
 
     # Convert exposure to time
-    if exposure_units in ["s", "sec", "second", "seconds"]:
+    if exposure_units in _TIME_UNITS:
         exposure_time = exposure
-    elif exposure_units in ["cm", "centimeter", "centimeters"]:
+    elif exposure_units in _LENGTH_UNITS:
         exposure_time = exposure / flow_velocity
     else:
         raise ValueError(
@@ -262,6 +310,11 @@ def fit_first_order_kinetics(
         )
 
     # Fit data with linear regression
-    log_concentrations = np.log(concentrations)
+    if compute_stats:
+        return linregress(exposure_time, log_concentrations)
+
+    # Closed-form least squares for slope and intercept only
+    slope = _fast_slope(exposure_time, log_concentrations)
+    intercept = log_concentrations.mean() - slope * exposure_time.mean()
 
-    return linregress(exposure_time, log_concentrations)
+    return slope, intercept, np.nan, np.nan, np.nan
@@ -8,16 +8,16 @@ Constants:
 - UNIVERSAL_GAS_CONSTANT: Universal gas constant in kg m2 s-2 K-1 mol-1.
 - BOLTZMANN_CONSTANT: Boltzmann constant in kg m2 s-2 K-1.
 - AVOGADROS_NUMBER: Avogadro's number in mol-1.
-- P_CF: Conversion factors to Pascal for Torr, bar, mbar, hPa, and Pa pressure units.
+- P_UNITS: Supported pressure units (Torr, bar, mbar, hPa, and Pa).
+- P_CF: Conversion factors to Pascal for P_UNITS, keyed by casefolded
+  unit name (e.g. P_CF["torr"]).
 
 """
 
 from warnings import warn
 import numpy as np
-import pandas as pd
+from numpy.typing import NDArray, ArrayLike
 import molmass as mm
-from tabulate import tabulate
-from requests.structures import CaseInsensitiveDict
 
 
 ### Constants ###
@@ -32,16 +32,13 @@ AVOGADROS_NUMBER = 6.0221408e23  # mol-1
 MOLES_PER_SCCM = (
     STANDARD_PRESSURE_Pa * (1e-2) ** 3 / UNIVERSAL_GAS_CONSTANT / STANDARD_TEMPERATURE_K
 )
+_QUARTER_PI = 0.25 * np.pi  # area of a circle per squared diameter
 
-P_CF = CaseInsensitiveDict(
-    {
-        "Torr": 133.322,
-        "bar": 1e5,
-        "mbar": 100,
-        "hPa": 100,
-        "Pa": 1,
-    }
-)  # conversion factors to Pa
+P_UNITS = ("Torr", "bar", "mbar", "hPa", "Pa")  # supported pressure units
+P_CF = {
+    unit.casefold(): cf
+    for unit, cf in zip(P_UNITS, (133.322, 1e5, 100, 100, 1))
+}  # conversion factors to Pa, keyed by casefolded unit name
 
 
 ### Concentrations conversions ###
@@ -148,23 +145,23 @@ def P_in_Pa(
         float: Pressure in Pa.
     """
 
-    return P * P_CF[units]
+    return P * P_CF[units.casefold()]
 
 
 ### Geometric Calculations ###
 def cross_sectional_area(
-    diameter: float,
-) -> float:
+    diameter: NDArray[np.float64] | float,
+) -> NDArray[np.float64] | float:
     """Calculate cross sectional area.
 
     Args:
-        diameter (float): Diameter.
+        diameter (float or NDArray): Diameter.
 
     Returns:
-        float: Cross sectional area.
+        float or NDArray: Cross sectional area.
     """
 
-    return np.pi * (diameter / 2) ** 2
+    return _QUARTER_PI * diameter * diameter
 
 
 def partial_cylinder_area(
@@ -211,6 +208,51 @@ def partial_cylinder_area(
     return perimeter, area
 
 
+### Input validation ###
+def check_hypothetical_gamma(
+    hypothetical_gamma: ArrayLike | float | int,
+    any_shape: bool = False,
+) -> NDArray[np.float64] | float | int:
+    """Validate hypothetical uptake coefficient input.
+
+    Args:
+        hypothetical_gamma (ArrayLike or float or int): Hypothetical
+            uptake coefficient (unitless).
+        any_shape (bool): Accept arrays of any shape (including 0-d)
+            and always return a C-contiguous float64 array. Otherwise
+            int and float are passed through and arrays must be
+            1-dimensional.
+
+    Returns:
+        NDArray or float or int: Validated hypothetical gamma.
+    """
+
+    if any_shape or not isinstance(hypothetical_gamma, (int, float)):
+        try:
+            hypothetical_gamma = np.asarray(hypothetical_gamma, dtype=np.float64)
+        except Exception as e:
+            raise TypeError(
+                "Gamma input must be int, float, or Array-like of int "
+                f"or float; got {type(hypothetical_gamma)}"
+            ) from e
+
+        if not any_shape and hypothetical_gamma.ndim != 1:
+            raise ValueError("Gamma input must be 1-dimensional.")
+        if hypothetical_gamma.size == 0:
+            raise ValueError("Gamma input must not be empty.")
+
+        # Copy only if needed; np.ascontiguousarray would promote 0-d
+        # input to 1-d
+        if any_shape and not hypothetical_gamma.flags.c_contiguous:
+            hypothetical_gamma = hypothetical_gamma.copy(order="C")
+
+    # Check if hypothetical_gamma is between 0 and 1
+    if np.min(hypothetical_gamma) < 0 or np.max(hypothetical_gamma) > 1:
+        raise ValueError("Hypothetical gamma must be between 0 and 1")
+
+    return hypothetical_gamma
+
+
 ### Display Calculations ###
 def table(
     title: str,
@@ -231,15 +273,17 @@ def table(
     Returns:
         None
     """
+    # Imported here so non-display code paths skip the import cost
+    from tabulate import tabulate
 
-    data = pd.DataFrame(
-        [var_names, [format(v, "8" + fmt) for v, fmt in zip(var, var_fmts)], units]
-    ).T
+    rows = [
+        [name, format(v, "8" + fmt), unit]
+        for name, v, fmt, unit in zip(var_names, var, var_fmts, units)
+    ]
     table = tabulate(
-        data,  # pyright: ignore[reportArgumentType]
+        rows,
         disable_numparse=True,
         tablefmt="fancy_grid",
-        showindex=False,
     )
 
     # Center the title based on the table width
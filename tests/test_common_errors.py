@@ -1,6 +1,6 @@
 # tests/test_common_errors.py
 import pytest
-from flowtube import CoatedWallReactor, BoatReactor
+from flowtube import CoatedWallReactor, BoatReactor, kinetics
 import numpy as np
 
 """ Tests for common errors across Reactor classes. """
@@ -63,7 +63,10 @@ def test_unsupported_pressure_units_initialize(
 ):
     obj, _, _ = build_reactor(Reactor, call_initialize=False)
     bad_init = make_init_kwargs(Reactor, P_units="atmz")
-    with pytest.raises(ValueError, match=r"Unsupported pressure units"):
+    with pytest.raises(
+        ValueError,
+        match=r"Unsupported pressure units. Supported units: Torr, bar, mbar, hPa, Pa",
+    ):
         obj.initialize(**bad_init)
 
 
@@ -164,7 +167,7 @@ def test_fitting_invalid_exposure_units(Reactor, build_reactor):
 def test_fitting_negative_concentrations(Reactor, build_reactor):
     obj, _, _ = build_reactor(Reactor)
     obj.reactant_uptake(hypothetical_gamma=1e-7, disp=False)
-    with pytest.raises(ValueError, match=r"Concentrations must be non-negative"):
+    with pytest.raises(ValueError, match=r"Concentrations must be positive and finite"):
         obj.calculate_gamma_effective(
             concentrations=np.array([-0.01, 0.02, 0.03]),
             exposure=np.array([0.1, 0.2, 0.3]),
@@ -172,6 +175,18 @@ def test_fitting_negative_concentrations(Reactor, build_reactor):
         )
 
 
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_fitting_zero_concentrations(Reactor, build_reactor):
+    obj, _, _ = build_reactor(Reactor)
+    obj.reactant_uptake(hypothetical_gamma=1e-7, disp=False)
+    with pytest.raises(ValueError, match=r"Concentrations must be positive and finite"):
+        obj.calculate_gamma_effective(
+            concentrations=np.array([0.0, 0.02, 0.03]),
+            exposure=np.array([0.1, 0.2, 0.3]),
+            exposure_units="s",
+        )
+
+
 @pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
 def test_fitting_non_arraylike_inputs(Reactor, build_reactor):
     obj, _, _ = build_reactor(Reactor)
@@ -189,3 +204,51 @@ def test_fitting_non_arraylike_inputs(Reactor, build_reactor):
             exposure=[0.1, 0.2, 0.3],
             exposure_units="s",
         )
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_uptake_batch_errors(Reactor, build_reactor):
+    obj, _, _ = build_reactor(Reactor, call_initialize=False)
+    with pytest.raises(RuntimeError, match=r"Must call initialize"):
+        obj.reactant_uptake_batch([1e-3, 1e-2])
+
+    obj, _, _ = build_reactor(Reactor)
+    with pytest.raises(ValueError, match=r"Hypothetical gamma must be between 0 and 1"):
+        obj.reactant_uptake_batch([[1e-3, 2.0]])
+
+
+@pytest.mark.parametrize("compute_stats", [True, False], ids=["full", "fast"])
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_fitting_identical_exposures(Reactor, build_reactor, compute_stats):
+    obj, _, _ = build_reactor(Reactor)
+    with pytest.raises(ValueError, match=r"all x values are identical"):
+        kinetics.fit_first_order_kinetics(
+            obj,
+            concentrations=np.array([1.0, 0.5]),
+            exposure=np.array([1.0, 1.0]),
+            exposure_units="s",
+            compute_stats=compute_stats,
+        )
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+@pytest.mark.parametrize(
+    "gamma, message",
+    [
+        (np.array(0.1), r"Gamma input must be 1-dimensional"),
+        (np.float32(0.1), r"Gamma input must be 1-dimensional"),
+        ([], r"Gamma input must not be empty"),
+    ],
+    ids=["0d-array", "float32", "empty"],
+)
+def test_reactant_uptake_gamma_shape_errors(Reactor, build_reactor, gamma, message):
+    obj, _, _ = build_reactor(Reactor)
+    with pytest.raises(ValueError, match=message):
+        obj.reactant_uptake(gamma, disp=False)
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_uptake_batch_empty_gamma(Reactor, build_reactor):
+    obj, _, _ = build_reactor(Reactor)
+    with pytest.raises(ValueError, match=r"Gamma input must not be empty"):
+        obj.reactant_uptake_batch([])
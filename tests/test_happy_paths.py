@@ -1,8 +1,10 @@
 # tests/test_happy_paths.py
 import pytest
 import warnings
+import numpy as np
 from flowtube.coated_wall_reactor import CoatedWallReactor
 from flowtube.boat_reactor import BoatReactor
+from flowtube import kinetics
 
 BOTH = [CoatedWallReactor, BoatReactor]
 
@@ -39,3 +41,92 @@ def test_supported_carrier_gases_ctor(
 ):
     kwargs = make_constructor_kwargs(Reactor, carrier_gas=carrier)
     Reactor(**kwargs)  # Should not raise
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_scalar_and_array_gamma_uptake_agree(
+    Reactor,
+    build_reactor,
+):
+    warnings.filterwarnings("ignore")
+    obj, _, _ = build_reactor(Reactor)
+    gammas = np.array([1e-5, 1e-3, 0.1])
+
+    obj.reactant_uptake(gammas, disp=False)
+    array_uptake = np.copy(obj.uptake)
+
+    for i, gamma in enumerate(gammas):
+        obj.reactant_uptake(float(gamma), disp=False)
+        assert obj.uptake == pytest.approx(array_uptake[i])
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_fit_without_stats_matches_full_fit(
+    Reactor,
+    build_reactor,
+):
+    warnings.filterwarnings("ignore")
+    obj, _, _ = build_reactor(Reactor)
+    exposure = np.linspace(0.0, 2.0, 10)
+    concentrations = np.exp(-1.5 * exposure) * (1 + 0.01 * np.sin(exposure))
+
+    full = kinetics.fit_first_order_kinetics(obj, concentrations, exposure, "s")
+    fast = kinetics.fit_first_order_kinetics(
+        obj, concentrations, exposure, "s", compute_stats=False
+    )
+
+    assert fast[0] == pytest.approx(full[0])
+    assert fast[1] == pytest.approx(full[1])
+    assert np.isnan(fast[2:]).all()
+
+
+@pytest.mark.parametrize(
+    "Reactor, constructor_overrides",
+    [
+        (CoatedWallReactor, None),
+        (CoatedWallReactor, dict(insert_ID=1.0, insert_OD=1.2, insert_length=10.0)),
+        (BoatReactor, None),
+    ],
+    ids=["CoatedWall", "CoatedWallInsert", "Boat"],
+)
+@pytest.mark.parametrize(
+    "gammas",
+    [np.logspace(-6, 0, 12).reshape(3, 4), np.array(1e-3)],
+    ids=["2d", "0d"],
+)
+def test_uptake_batch_matches_reactant_uptake(
+    Reactor,
+    constructor_overrides,
+    gammas,
+    build_reactor,
+):
+    warnings.filterwarnings("ignore")
+    obj, _, _ = build_reactor(Reactor, constructor_overrides=constructor_overrides)
+
+    batch_uptake = obj.reactant_uptake_batch(gammas)
+    assert batch_uptake.shape == gammas.shape
+
+    obj.reactant_uptake(gammas.ravel(), disp=False)
+    np.testing.assert_allclose(batch_uptake.ravel(), obj.uptake)
+
+
+@pytest.mark.parametrize("Reactor", BOTH, ids=["CoatedWall", "Boat"])
+def test_cylinder_loss_broadcasts_scalar_gamma_over_array_time(
+    Reactor,
+    build_reactor,
+):
+    warnings.filterwarnings("ignore")
+    obj, _, _ = build_reactor(Reactor)
+    times = np.array([1.0, 2.0])
+
+    losses = kinetics.cylinder_loss(
+        obj, obj.FT_ID, obj.N_eff_Shw_FT, obj.Kn_FT, 1e-3, times
+    )
+
+    assert losses.shape == times.shape
+    for loss, time in zip(losses, times):
+        assert loss == pytest.approx(
+            kinetics.cylinder_loss(
+                obj, obj.FT_ID, obj.N_eff_Shw_FT, obj.Kn_FT, 1e-3, float(time)
+            )
+        )